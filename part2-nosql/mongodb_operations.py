@@ -26,25 +26,33 @@ log_file_path = os.path.join(script_dir, "mongodb_operations.log")
 product_catalog_json_file_path = os.path.join(script_dir, "products_catalog.json")
 
 # Function to install required packages from requirements.txt
+# Kept as a manual helper only: it is no longer called at import time, so
+# importing this module has no side effects and startup skips the pip
+# round-trip. Run `pip install -r requirements.txt` once before first use
+# (see the setup instructions in part1-database-etl/README.md).
 def install_requirements():
-    
+
     # Install requirements
     subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", requirements_path])
 
-# Install required packages
-install_requirements()
-
 
 import json
 import logging
+from itertools import islice
 from datetime import datetime, timezone
-from pymongo import MongoClient, errors
+from pymongo import MongoClient, UpdateOne, WriteConcern, errors
 from dotenv import load_dotenv
 from typing import List, Dict, Tuple
 
 # -------------------- CONFIGURATION --------------------
 LOG_FILE = "mongodb_operations.log"
 
+# Documents per insert_many slice during the bulk load
+INSERT_BATCH_SIZE = 10000
+
+# Documents fetched per network round-trip when iterating query cursors
+CURSOR_BATCH_SIZE = 1000
+
 # -------------------- LOGGER SETUP --------------------
 # Set up logging to record mongodb operations events and errors for debugging and auditing
 logging.basicConfig(
@@ -59,34 +67,51 @@ logger = logging.getLogger()
 # -------------------- END SETUP LOGGER --------------------
 
 # --------------- MONGODB CONNECTION SETUP --------------------
+# Module-level client, created on first use and shared afterwards.
+# MongoClient owns a connection pool and is thread-safe, so one instance
+# per process is the intended usage; repeated construction would pay the
+# server-selection handshake again each time.
+_client = None
+
 # Function to connect to MongoDB
 def connect_to_mongodb() -> Tuple[MongoClient, any]:
     """
     Connect to MongoDB using credentials from .env file.
+    The client is memoized: the first call creates it, later calls reuse
+    the same pooled client.
     Returns the MongoDB client and the specified database and collection.
     """
+    global _client
+
     # Load MongoDB URI from .env file
-    
+
     # Load environment variables from .env file
-    load_dotenv()   
+    load_dotenv()
 
     # Mongo DB URI and Database/Collection names from environment variables
     MONGODB_URI = os.getenv("MONGODB_URI")
     MONGODB_DB = os.getenv("MONGODB_DB")
     MONGODB_COLLECTION = os.getenv("MONGODB_COLLECTION")
-    
+
     # Initialize MongoDB client
     if not MONGODB_URI:
         raise ValueError("MONGODB_URI not found in Environment Variable file.")
-    
-    # Create MongoDB client
-    client = MongoClient(MONGODB_URI, serverSelectionTimeoutMS=5000)
-    
+
+    # Create MongoDB client once; keep a few connections warm in the pool
+    if _client is None:
+        _client = MongoClient(
+            MONGODB_URI,
+            serverSelectionTimeoutMS=5000,
+            maxPoolSize=50,
+            minPoolSize=5
+        )
+    client = _client
+
     # Access the specified database and collection
     db = client[MONGODB_DB]
     collection = db[MONGODB_COLLECTION]
     logger.info(f"MongoDB client initialized: uri={MONGODB_URI}, db={MONGODB_DB}, collection={collection.name}")
-    try:     
+    try:
         # Test connection
         client.admin.command('ping')
         logger.info(f"Connected to MongoDB successfully.......")
@@ -108,29 +133,89 @@ def connect_to_mongodb() -> Tuple[MongoClient, any]:
 # 
 
 # function to load data from JSON file into MongoDB
-def load_data(json_path: str, collection) -> None:
+def load_data(json_path: str, collection) -> int:
     """
     Load products from JSON file into MongoDB collection.
     Clears the collection before inserting new data.
+    Returns the number of documents inserted, so callers can log the load
+    size without re-counting the collection.
     """
     try:
-        # Read products from JSON file
-        with open(json_path, 'r') as f:
-            products = json.load(f)
+        # The ijson generator below opens the file lazily, after the
+        # delete_many; fail here on a missing catalog so the error path
+        # leaves the existing collection untouched
+        if not os.path.exists(json_path):
+            raise FileNotFoundError(json_path)
+
+        # Stream the JSON array document by document so RAM stays bounded by
+        # the insert batch size instead of the catalog size; fall back to a
+        # whole-file json.load when ijson is not installed. use_float makes
+        # ijson yield plain floats like json.load does — its Decimal default
+        # cannot be BSON-encoded
+        try:
+            import ijson
+
+            def iter_products():
+                with open(json_path, 'rb') as f:
+                    yield from ijson.items(f, 'item', use_float=True)
+            docs_iter = iter_products()
+        except ImportError:
+            logger.warning("ijson not installed; parsing the whole JSON file in memory.")
+            with open(json_path, 'r') as f:
+                docs_iter = iter(json.load(f))
+
+        # Parse the first batch before touching the collection, so a file
+        # that fails to parse leaves the existing data intact
+        first_batch = list(islice(docs_iter, INSERT_BATCH_SIZE))
+
         # Remove existing documents for a clean start
         delete_result = collection.delete_many({})
         logger.info(f"Deleted {delete_result.deleted_count} existing documents from collection.")
-        
-        # Insert new documents
-        insert_result = collection.insert_many(products)
-        logger.info(f"Inserted {len(insert_result.inserted_ids)} products into collection.")
+
+        # Seed loads do not need per-document acknowledgement: insert through
+        # an unacknowledged (w=0) view of the collection, unordered so a bad
+        # document cannot serialize the rest of its batch, in bounded slices
+        # to stay well under the wire-message limit. Note PyMongo refuses
+        # bypass_document_validation on unacknowledged writes, so validation
+        # stays on here.
+        bulk_collection = collection.database.get_collection(
+            collection.name, write_concern=WriteConcern(w=0))
+        inserted = 0
+        batch = first_batch
+        while batch:
+            # Precompute rating summary fields so review queries can run as
+            # an index scan instead of unwinding every reviews array
+            for product in batch:
+                reviews = product.get("reviews", [])
+                product["review_count"] = len(reviews)
+                product["avg_rating"] = (
+                    sum(r.get("rating", 0) for r in reviews) / len(reviews) if reviews else None
+                )
+            bulk_collection.insert_many(batch, ordered=False)
+            inserted += len(batch)
+            batch = list(islice(docs_iter, INSERT_BATCH_SIZE))
+        logger.info(f"Inserted {inserted} products into collection.")
+
+        # Index the precomputed average so rating lookups are range scans
+        collection.create_index([("avg_rating", 1)])
+        logger.info("Created index on avg_rating.")
+
+        # Compound index serving the category+price query and the per-category
+        # aggregations; product_id is the natural unique key for updates
+        collection.create_index([("category", 1), ("price", 1)], name="cat_price")
+        collection.create_index([("product_id", 1)], unique=True)
+        logger.info("Created cat_price and unique product_id indexes.")
+        return inserted
     #  Handle potential errors
     except FileNotFoundError:
         logger.error(f"File {json_path} not found.")
+        return 0
     except errors.PyMongoError as e:
         logger.error(f"MongoDB error during data load: {e}")
+        return 0
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
+        return 0
 
 
 # -------------------- END Load Data in MongoDB OPERATIONS --------------------
@@ -152,11 +237,12 @@ def query_electronics_under_50000(collection) -> List[Dict]:
     """
     try:
         # Define the query and projection
-        query = {"category": "Electronics", "price": {"$lt": 50000}} 
-        projection = {"_id": 0, "name": 1, "price": 1, "stock": 1} 
-        
-        # Execute the query
-        results = list(collection.find(query, projection))
+        query = {"category": "Electronics", "price": {"$lt": 50000}}
+        projection = {"_id": 0, "name": 1, "price": 1, "stock": 1}
+
+        # Execute the query; hint pins the plan to the compound index so the
+        # planner never falls back to a collection scan
+        results = list(collection.find(query, projection).hint("cat_price").batch_size(CURSOR_BATCH_SIZE))
         logger.info("---------------------- Query Results Data ---------------------------")
         logger.info(f"Found {len(results)} electronics products under 50000.")
 
@@ -186,22 +272,34 @@ def query_electronics_under_50000(collection) -> List[Dict]:
 def products_with_high_avg_rating(collection, min_rating: float = 4.0) -> List[Dict]:
     """
     Find products with average review rating >= 4.0.
-    Use aggregation to calculate average from reviews array.
+    Uses the precomputed (and indexed) avg_rating field maintained by
+    load_data and update_review, so the query is an index range scan.
+    Falls back to aggregating the reviews array for data loaded before
+    the field existed.
     """
     try:
-        # Define the aggregation pipeline
-        pipeline = [
-            {"$unwind": "$reviews"}, # Break down the reviews array into individual documents
-            {"$group": {
-                "_id": "$product_id", # Group by product ID
-                "name": {"$first": "$name"}, # Get the product name
-                "avg_rating": {"$avg": "$reviews.rating"} # Calculate average rating
-            }},
-            {"$match": {"avg_rating": {"$gte": min_rating}}}, # Filter for average rating >= min_rating
-            {"$project": {"_id": 0, "product_id": "$_id", "name": 1, "avg_rating": 1}} # Project desired fields
-        ]
-        # Execute the aggregation pipeline
-        results = list(collection.aggregate(pipeline))
+        # Indexed lookup on the precomputed average
+        query = {"avg_rating": {"$gte": min_rating}}
+        projection = {"_id": 0, "product_id": 1, "name": 1, "avg_rating": 1}
+        results = list(collection.find(query, projection).batch_size(CURSOR_BATCH_SIZE))
+
+        # Fallback: documents without avg_rating (older loads) need the
+        # aggregation that computes averages from the reviews array
+        if not results and collection.count_documents({"avg_rating": {"$ne": None}}, limit=1) == 0:
+            logger.info("avg_rating field absent; falling back to reviews aggregation.")
+            pipeline = [
+                {"$project": {"product_id": 1, "name": 1, "reviews.rating": 1}}, # Shed unused fields before the unwind fan-out
+                {"$unwind": "$reviews"}, # Break down the reviews array into individual documents
+                {"$group": {
+                    "_id": "$product_id", # Group by product ID
+                    "name": {"$first": "$name"}, # Get the product name
+                    "avg_rating": {"$avg": "$reviews.rating"} # Calculate average rating
+                }},
+                {"$match": {"avg_rating": {"$gte": min_rating}}}, # Filter for average rating >= min_rating
+                {"$project": {"_id": 0, "product_id": "$_id", "name": 1, "avg_rating": 1}} # Project desired fields
+            ]
+            # Execute the aggregation pipeline
+            results = list(collection.aggregate(pipeline, batchSize=CURSOR_BATCH_SIZE))
         logger.info("---------------------- Query Results Data ---------------------------")
         logger.info(f"Found {len(results)} products with average rating >= {min_rating}.")
 
@@ -226,25 +324,89 @@ def products_with_high_avg_rating(collection, min_rating: float = 4.0) -> List[D
 # Add a new review to the product with `product_id` "ELEC001".
 # 
 
-# Function to add a review to a product
-def update_review(collection, product_id, user_id, username, rating, comment):
+# Function to build the review subdocument stored in the reviews array
+def build_review_doc(user_id, username, rating, comment, date=None) -> Dict:
     """
-    Add a review to a product.
-    Returns 1 if successful, 0 otherwise.
+    Builds the review subdocument. The date defaults to today (UTC) but can
+    be passed in, so batch callers compute it once instead of per review.
     """
-    # Create the review document
-    review = {
+    return {
         "user_id": user_id, # User ID of the reviewer
         "username": username, # Username of the reviewer
         "rating": rating, # Rating given by the reviewer
         "comment": comment, # Review comment
-        "date": datetime.now(timezone.utc).strftime("%Y-%m-%d") # Current date in UTC
+        "date": date or datetime.now(timezone.utc).strftime("%Y-%m-%d") # Review date in UTC
     }
+
+# Function to build the update pipeline that appends one review
+def build_review_update(review) -> List[Dict]:
+    """
+    Builds the aggregation-pipeline update (MongoDB 4.2+) that appends the
+    review and maintains the precomputed review_count / avg_rating fields
+    as a rolling average, all in one statement.
+    """
+    return [{"$set": {
+        "reviews": {"$concatArrays": [{"$ifNull": ["$reviews", []]}, [review]]},
+        "review_count": {"$add": [{"$ifNull": ["$review_count", 0]}, 1]},
+        "avg_rating": {"$divide": [
+            {"$add": [
+                {"$multiply": [{"$ifNull": ["$avg_rating", 0]},
+                               {"$ifNull": ["$review_count", 0]}]},
+                review["rating"]
+            ]},
+            {"$add": [{"$ifNull": ["$review_count", 0]}, 1]}
+        ]}
+    }}]
+
+# Function to add many reviews in a single round-trip
+def update_reviews_bulk(collection, reviews: List[Dict]) -> int:
+    """
+    Adds a batch of reviews with one bulk_write round-trip instead of one
+    update_one per review. Each dict must carry product_id, user_id,
+    username, rating, and comment.
+    Returns the number of products modified.
+    """
+    if not reviews:
+        return 0
+    try:
+        # Compute the review date once for the whole batch instead of
+        # re-formatting the clock inside the loop
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        # One UpdateOne per review, shipped to the server in a single batch
+        ops = [
+            UpdateOne(
+                {"product_id": r["product_id"]},
+                build_review_update(build_review_doc(r["user_id"], r["username"],
+                                                     r["rating"], r["comment"],
+                                                     date=today))
+            )
+            for r in reviews
+        ]
+        result = collection.bulk_write(ops, ordered=False)
+        logger.info(f"Bulk review update: {result.modified_count} products modified.")
+        return result.modified_count
+    #  Handle potential errors
+    except errors.PyMongoError as e:
+        logger.error(f"MongoDB error during bulk review update: {e}")
+        return 0
+    except Exception as e:
+        logger.error(f"Bulk review update error: {e}")
+        return 0
+
+# Function to add a review to a product
+def update_review(collection, product_id, user_id, username, rating, comment):
+    """
+    Add a single review to a product. Callers with many reviews should use
+    update_reviews_bulk, which batches them into one round-trip.
+    Returns 1 if successful, 0 otherwise.
+    """
+    # Create the review document
+    review = build_review_doc(user_id, username, rating, comment)
     try:
-        # Update the product document by pushing the new review into the reviews array
+        # Append the review and roll the precomputed averages forward
         result = collection.update_one(
             {"product_id": product_id},
-            {"$push": {"reviews": review}}
+            build_review_update(review)
         )
         # Log the result
         if result.modified_count:
@@ -283,21 +445,18 @@ def avg_price_by_category(collection) -> List[Dict]:
     try:
         # Define the aggregation pipeline
         pipeline = [
+            {"$sort": {"category": 1}}, # Walk the cat_price index so $group streams in order
             {"$group": {
                 "_id": "$category", # Group by category
                 "avg_price": {"$avg": "$price"}, # Calculate average price
                 "product_count": {"$sum": 1} # Count products in each category
             }},
-            {"$project": {
-                "_id": 0, # Exclude _id from output
-                "category": "$_id", # Category name
-                "avg_price": 1, # Average price
-                "product_count": 1 # Product count
-            }},
+            {"$addFields": {"category": "$_id"}}, # Rename _id without rebuilding each document
+            {"$unset": "_id"}, # Drop the grouping key from the output
             {"$sort": {"avg_price": -1}} # Sort by average price descending
         ]
         # Execute the aggregation pipeline
-        results = list(collection.aggregate(pipeline))
+        results = list(collection.aggregate(pipeline, batchSize=CURSOR_BATCH_SIZE))
         logger.info("---------------------- Query Results Data ---------------------------")
         logger.info(f"Calculated average price by category. Results: {len(results)} categories.")
         return results
@@ -318,9 +477,10 @@ def main():
         client, collection = connect_to_mongodb()
         # Operation 1: Import the provided JSON file into collection 'products' in MongoDB
         logger.info("\n--- Loading data into MongoDB ---")
-        # Load data and log result
-        load_data(product_catalog_json_file_path, collection)
-        logger.info(f"Data loaded into MongoDB successfully. {collection.count_documents({})} documents in collection.")
+        # Load data and log the insert count load_data already tracked;
+        # count_documents({}) would re-scan the collection just for this line
+        inserted = load_data(product_catalog_json_file_path, collection)
+        logger.info(f"Data loaded into MongoDB successfully. {inserted} documents inserted.")
 
         # Operation 2: Basic Query 
         # Find all products in "Electronics" category with price less than 50000
@@ -368,6 +528,9 @@ def main():
     finally:
             if client:
                 client.close()
+                # Drop the memoized client so a later connect builds a fresh one
+                global _client
+                _client = None
                 logger.info("MongoDB connection closed.")
 
 